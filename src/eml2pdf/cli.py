@@ -9,6 +9,16 @@ from .convert import batch_convert
 
 def _parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Batch convert EML files to PDFs")
+
+    def _positive_int(value: str) -> int:
+        try:
+            n = int(value)
+        except ValueError:
+            n = 0
+        if n < 1:
+            p.error(f"argument --jobs: expected a positive integer, got {value!r}")
+        return n
+
     p.add_argument("input_path", type=Path, help="EML file or directory")
     p.add_argument("output_dir", type=Path, help="Output directory for PDFs")
     p.add_argument("--recursive", action="store_true", help="Recurse into subdirectories")
@@ -19,6 +29,12 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default="attachments",
         help="Directory (within output) for saved attachments",
     )
+    p.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
     return p.parse_args(argv)
 
 
@@ -32,6 +48,7 @@ def main(argv: list[str] | None = None) -> int:
             args.overwrite,
             extract_attachments=not args.no_attachments,
             attachments_dirname=args.attachments_dir,
+            jobs=args.jobs,
         )
     except FileExistsError as e:
         print(f"error: {e}", file=sys.stderr)
@@ -3,18 +3,100 @@ from __future__ import annotations
 import email
 import html
 import mimetypes
+import mmap
 import os
 import re
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import suppress
 from dataclasses import dataclass
 from email import policy
+from email.feedparser import BytesFeedParser
 from email.message import EmailMessage
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Iterable
 
 from bs4 import BeautifulSoup
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.textobject import PDFTextObject
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Small EMLs are read in one call; larger ones are memory-mapped and fed to
+# the parser in chunks.
+_SLURP_MAX_BYTES = 4 * 1024 * 1024
+_FEED_CHUNK_BYTES = 256 * 1024
+
+# Parsed emails allowed to queue for the render thread in serial batches.
+_PIPELINE_DEPTH = 2
+
+# Plain-text bodies shorter than this (with no HTML or attachments) skip
+# WeasyPrint and go straight to the ReportLab renderer.
+_TEXT_FAST_PATH_MAX_CHARS = 1024
+# Usable width of a ReportLab text page (letter with one-inch margins).
+_TEXT_LINE_WIDTH = letter[0] - 2 * inch
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+_WS_COLLAPSE = re.compile(r"\n{3,}")
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+_STYLE_BLOCK = """
+body { font-family: Arial, sans-serif; font-size: 12px; color: #111; }
+.meta { margin-bottom: 16px; }
+.meta div { margin: 2px 0; }
+.content { margin-top: 8px; }
+pre { white-space: pre-wrap; font-family: Arial, sans-serif; }
+h2 { margin-top: 24px; font-size: 14px; }
+"""
+
+_HTML_TEMPLATE = """
+<!doctype html>
+<html>
+  <head>
+    <meta charset="utf-8" />
+  </head>
+  <body>
+    <div class="meta">
+      <div><strong>Subject:</strong> {subject}</div>
+      <div><strong>From:</strong> {sender}</div>
+      <div><strong>To:</strong> {to}</div>
+      <div><strong>Date:</strong> {date}</div>
+    </div>
+    <div class="content">{body}</div>
+    {attachments}
+  </body>
+</html>
+"""
+
+_ATTACHMENT_ITEM = "<li><strong>{}</strong> ({}, {} bytes)</li>"
+
+try:
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    _FONT_CONFIG = FontConfiguration()
+    _BASE_CSS = CSS(string=_STYLE_BLOCK, font_config=_FONT_CONFIG)
+    _WEASYPRINT_OK = True
+except Exception:
+    _WEASYPRINT_OK = False
+
+# Read once at import: with the text path forced (or WeasyPrint missing) the
+# HTML document is never built.
+_FORCE_TEXT = os.environ.get("EML2PDF_FORCE_TEXT") == "1"
+_USE_HTML_RENDERER = _WEASYPRINT_OK and not _FORCE_TEXT
 
 
 @dataclass
@@ -23,8 +105,25 @@ class EmailContent:
     sender: str
     to: str
     date: str
-    body_text: str
-    body_html: str
+    text_part: EmailMessage | None = None
+    html_part: EmailMessage | None = None
+
+    # Body parts are charset-decoded on first access, so a renderer that only
+    # needs one of them never pays for decoding the other.
+    @cached_property
+    def body_text(self) -> str:
+        return _decode_body(self.text_part)
+
+    @cached_property
+    def body_html(self) -> str:
+        return _decode_body(self.html_part)
+
+
+def _decode_body(part: EmailMessage | None) -> str:
+    if part is None:
+        return ""
+    content = part.get_content()
+    return str(content).strip() if content else ""
 
 
 @dataclass
@@ -37,98 +136,160 @@ class Attachment:
 
 
 def _read_eml(path: Path) -> EmailMessage:
-    with path.open("rb") as f:
-        return email.message_from_binary_file(f, policy=policy.default)
+    if path.stat().st_size < _SLURP_MAX_BYTES:
+        return email.message_from_bytes(path.read_bytes(), policy=policy.default)
+    # Map large files and feed the parser slice by slice, so the kernel pages
+    # the file in on demand and no full-size bytes copy is ever built.
+    parser = BytesFeedParser(policy=policy.default)
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start in range(0, len(mm), _FEED_CHUNK_BYTES):
+            parser.feed(mm[start : start + _FEED_CHUNK_BYTES])
+    return parser.close()
 
 
 def _extract_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style"]):
-        tag.decompose()
-    text = soup.get_text("\n")
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        for node in tree.css("script, style"):
+            node.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator="\n") if root is not None else ""
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+        for tag in soup(["script", "style"]):
+            tag.decompose()
+        text = soup.get_text("\n")
     # Collapse excessive whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _WS_COLLAPSE.sub("\n\n", text)
     return text.strip()
 
 
-def _get_body_parts(msg: EmailMessage) -> tuple[str, str]:
+def _extract_headers(msg: EmailMessage) -> dict[str, str]:
+    # One pass over the raw headers; only the four we print are handed to the
+    # policy's header factory, exactly as msg.get() would decode them.
+    wanted = {"subject": "", "from": "", "to": "", "date": ""}
+    seen: set[str] = set()
+    for name, raw in msg.raw_items():
+        key = name.lower()
+        if key in wanted and key not in seen:
+            wanted[key] = str(msg.policy.header_fetch_parse(name, raw))
+            seen.add(key)
+            if len(seen) == len(wanted):
+                break
+    return wanted
+
+
+def _parse_message(
+    msg: EmailMessage, attachments_dir: Path | None = None
+) -> tuple[EmailContent, list[Attachment]]:
+    # One traversal of the MIME tree selects the body parts and, when
+    # attachments_dir is given, collects attachment/inline parts to save.
+    collect = attachments_dir is not None
+    text_part = None
+    html_part = None
+    attachment_parts: list[EmailMessage] = []
+
     if msg.is_multipart():
-        # Prefer plain text, fallback to html
-        text_part = None
-        html_part = None
-        for part in msg.walk():
-            if part.get_content_disposition() == "attachment":
+        # Depth-first in document order. Parts below an attachment are never
+        # body candidates; without attachments to collect, stop as soon as
+        # both bodies are found.
+        stack = [(msg, False)]
+        while stack:
+            part, in_attachment = stack.pop()
+            disposition = part.get_content_disposition()
+            in_attachment = in_attachment or disposition == "attachment"
+            if part.is_multipart():
+                if collect or not in_attachment:
+                    children = reversed(part.get_payload())
+                    stack.extend((child, in_attachment) for child in children)
+                continue
+            if collect and disposition in ("attachment", "inline"):
+                attachment_parts.append(part)
+            if in_attachment:
                 continue
             ctype = part.get_content_type()
             if ctype == "text/plain" and text_part is None:
-                text_part = part.get_content()
+                text_part = part
             elif ctype == "text/html" and html_part is None:
-                html_part = part.get_content()
-        return (
-            str(text_part).strip() if text_part else "",
-            str(html_part).strip() if html_part else "",
-        )
-
-    ctype = msg.get_content_type()
-    if ctype == "text/html":
-        return "", str(msg.get_content()).strip()
-    return str(msg.get_content()).strip(), ""
-
-
-def _extract_content(msg: EmailMessage) -> EmailContent:
-    subject = msg.get("subject", "")
-    sender = msg.get("from", "")
-    to = msg.get("to", "")
-    date = msg.get("date", "")
-    body_text, body_html = _get_body_parts(msg)
-    return EmailContent(
-        subject=subject,
-        sender=sender,
-        to=to,
-        date=date,
-        body_text=body_text,
-        body_html=body_html,
+                html_part = part
+            else:
+                continue
+            if not collect and text_part is not None and html_part is not None:
+                break
+    else:
+        if msg.get_content_type() == "text/html":
+            html_part = msg
+        else:
+            text_part = msg
+        if collect and msg.get_content_disposition() in ("attachment", "inline"):
+            attachment_parts.append(msg)
+
+    headers = _extract_headers(msg)
+    content = EmailContent(
+        subject=headers["subject"],
+        sender=headers["from"],
+        to=headers["to"],
+        date=headers["date"],
+        text_part=text_part,
+        html_part=html_part,
     )
+    attachments = _save_attachments(attachment_parts, attachments_dir) if collect else []
+    return content, attachments
 
 
 def _sanitize_filename(name: str, default: str) -> str:
     name = name.strip().replace("\\", "_").replace("/", "_")
     if not name:
         return default
-    return re.sub(r"[^A-Za-z0-9._-]+", "_", name)
+    return _UNSAFE_NAME.sub("_", name)
+
+
+@lru_cache(maxsize=64)
+def _guess_extension(content_type: str) -> str:
+    return mimetypes.guess_extension(content_type) or ""
 
 
-def _save_attachments(msg: EmailMessage, attachments_dir: Path) -> list[Attachment]:
+def _write_payload(path: str, payload: bytes) -> None:
+    # Raw fd writes skip the buffered file object, which would only copy
+    # an already fully materialized payload.
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _save_attachments(parts: Iterable[EmailMessage], attachments_dir: Path) -> list[Attachment]:
     attachments: list[Attachment] = []
     index = 1
     attachments_dir.mkdir(parents=True, exist_ok=True)
+    # Build per-attachment paths by string concatenation on a shared prefix
+    # rather than allocating intermediate Path objects.
+    base = os.fspath(attachments_dir) + os.sep
 
-    for part in msg.walk():
-        if part.is_multipart():
-            continue
-        disposition = part.get_content_disposition()
-        if disposition not in ("attachment", "inline"):
-            continue
-
+    for part in parts:
         filename = part.get_filename() or ""
         content_type = part.get_content_type()
-        ext = mimetypes.guess_extension(content_type) or ""
-        safe_name = _sanitize_filename(filename, f"attachment-{index}{ext}")
-
-        payload = part.get_payload(decode=True) or b""
-        saved_path = attachments_dir / safe_name
-        if saved_path.exists():
-            stem = saved_path.stem
-            suffix = saved_path.suffix
+        safe_name = _sanitize_filename(filename, "")
+        if not safe_name:
+            safe_name = f"attachment-{index}{_guess_extension(content_type)}"
+
+        payload = part.get_payload(decode=True)
+        if payload is None:
+            continue
+        if os.path.exists(base + safe_name):
+            stem, suffix = os.path.splitext(safe_name)
             counter = 1
             while True:
-                candidate = attachments_dir / f"{stem}-{counter}{suffix}"
-                if not candidate.exists():
-                    saved_path = candidate
-                    safe_name = saved_path.name
+                candidate = f"{stem}-{counter}{suffix}"
+                if not os.path.exists(base + candidate):
+                    safe_name = candidate
                     break
                 counter += 1
-        saved_path.write_bytes(payload)
+        saved_path = base + safe_name
+        _write_payload(saved_path, payload)
 
         content_id = part.get("Content-ID", "")
         if content_id:
@@ -139,7 +300,7 @@ def _save_attachments(msg: EmailMessage, attachments_dir: Path) -> list[Attachme
                 filename=safe_name,
                 content_type=content_type,
                 size=len(payload),
-                saved_path=saved_path,
+                saved_path=Path(saved_path),
                 content_id=content_id,
             )
         )
@@ -169,137 +330,155 @@ def _replace_cid_references(html_string: str, attachments: list[Attachment]) ->
     return str(soup)
 
 
+def _esc(text: str) -> str:
+    # Every escaped value lands in element content, never in an attribute, so
+    # quotes can stay as-is; that saves two of html.escape's five replace passes.
+    return html.escape(text, quote=False)
+
+
 def _build_email_html(content: EmailContent, attachments: list[Attachment]) -> str:
     body_html = content.body_html
     if not body_html and content.body_text:
-        body_html = f"<pre>{html.escape(content.body_text)}</pre>"
+        body_html = f"<pre>{_esc(content.body_text)}</pre>"
     if body_html:
         body_html = _replace_cid_references(body_html, attachments)
 
     attachment_html = ""
     if attachments:
-        items = "".join(
-            f"<li><strong>{html.escape(a.filename)}</strong> ({html.escape(a.content_type)}, {a.size} bytes)</li>"
+        items = [
+            _ATTACHMENT_ITEM.format(_esc(a.filename), _esc(a.content_type), a.size)
             for a in attachments
-        )
-        attachment_html = f"<h2>Attachments</h2><ul>{items}</ul>"
-
-    return f"""
-<!doctype html>
-<html>
-  <head>
-    <meta charset="utf-8" />
-    <style>
-      body {{ font-family: Arial, sans-serif; font-size: 12px; color: #111; }}
-      .meta {{ margin-bottom: 16px; }}
-      .meta div {{ margin: 2px 0; }}
-      .content {{ margin-top: 8px; }}
-      pre {{ white-space: pre-wrap; font-family: Arial, sans-serif; }}
-      h2 {{ margin-top: 24px; font-size: 14px; }}
-    </style>
-  </head>
-  <body>
-    <div class="meta">
-      <div><strong>Subject:</strong> {html.escape(content.subject)}</div>
-      <div><strong>From:</strong> {html.escape(content.sender)}</div>
-      <div><strong>To:</strong> {html.escape(content.to)}</div>
-      <div><strong>Date:</strong> {html.escape(content.date)}</div>
-    </div>
-    <div class="content">{body_html}</div>
-    {attachment_html}
-  </body>
-</html>
-"""
-
+        ]
+        attachment_html = f"<h2>Attachments</h2><ul>{''.join(items)}</ul>"
+
+    return _HTML_TEMPLATE.format_map(
+        {
+            "subject": _esc(content.subject),
+            "sender": _esc(content.sender),
+            "to": _esc(content.to),
+            "date": _esc(content.date),
+            "body": body_html,
+            "attachments": attachment_html,
+        }
+    )
 
-def _render_html_to_pdf(html_string: str, pdf_path: Path) -> bool:
-    if os.environ.get("EML2PDF_FORCE_TEXT") == "1":
-        return False
-    try:
-        from weasyprint import HTML
-    except Exception:
-        return False
 
-    HTML(string=html_string).write_pdf(str(pdf_path))
-    return True
+def _render_html_to_pdf(html_string: str, pdf_path: Path) -> None:
+    HTML(string=html_string).write_pdf(
+        str(pdf_path),
+        stylesheets=[_BASE_CSS],
+        font_config=_FONT_CONFIG,
+    )
 
 
 def _wrap_text(text: str, width: int) -> Iterable[str]:
     words = text.split()
     if not words:
         return []
-    line = words[0]
+    # Collect each line's words and join once when it is flushed, rather than
+    # growing a string word by word.
     lines = []
+    parts = [words[0]]
+    cur_len = len(words[0])
     for w in words[1:]:
-        if len(line) + 1 + len(w) <= width:
-            line += " " + w
+        new_len = cur_len + 1 + len(w)
+        if new_len <= width:
+            parts.append(w)
+            cur_len = new_len
         else:
-            lines.append(line)
-            line = w
-    lines.append(line)
+            lines.append(" ".join(parts))
+            parts = [w]
+            cur_len = len(w)
+    lines.append(" ".join(parts))
     return lines
 
 
-def _draw_paragraphs(c: canvas.Canvas, text: str, x: float, y: float, max_width: int, line_height: float) -> float:
+def _begin_text(
+    c: canvas.Canvas, x: float, y: float, line_height: float, font_name: str, font_size: float
+) -> PDFTextObject:
+    to = c.beginText(x, y)
+    to.setFont(font_name, font_size, line_height)
+    return to
+
+
+def _draw_paragraphs(
+    c: canvas.Canvas,
+    text: str,
+    x: float,
+    y: float,
+    max_width: int,
+    line_height: float,
+    font_name: str = "Helvetica",
+    font_size: float = 11,
+) -> float:
+    # One text object (a single BT/ET block) per page; lines advance with T*.
+    to = _begin_text(c, x, y, line_height, font_name, font_size)
     for para in text.split("\n"):
         if not para.strip():
+            to.textLine("")
             y -= line_height
             continue
         for line in _wrap_text(para, max_width):
             if y <= 1 * inch:
+                c.drawText(to)
                 c.showPage()
                 y = 10.5 * inch
-            c.drawString(x, y, line)
+                to = _begin_text(c, x, y, line_height, font_name, font_size)
+            to.textLine(line)
             y -= line_height
+    c.drawText(to)
     return y
 
 
-def convert_eml_to_pdf(
-    eml_path: Path,
-    pdf_path: Path,
-    overwrite: bool = False,
-    extract_attachments: bool = True,
-    attachments_dirname: str = "attachments",
-) -> None:
-    if pdf_path.exists() and not overwrite:
-        raise FileExistsError(f"Output exists: {pdf_path}")
-
-    msg = _read_eml(eml_path)
-    content = _extract_content(msg)
-
-    attachments: list[Attachment] = []
-    if extract_attachments:
-        attachments_dir = pdf_path.parent / attachments_dirname / eml_path.stem
-        attachments = _save_attachments(msg, attachments_dir)
+def _prefers_text_renderer(content: EmailContent, attachments: list[Attachment]) -> bool:
+    # Headers-only mail and short plain-text mail gain nothing from HTML
+    # layout, and ReportLab renders them far faster than WeasyPrint.
+    if attachments or content.html_part is not None:
+        return False
+    if len(content.body_text) >= _TEXT_FAST_PATH_MAX_CHARS:
+        return False
+    # ReportLab's built-in Helvetica only covers WinAnsi (cp1252); anything
+    # else would render as missing glyphs, so leave it to WeasyPrint.
+    text = f"{content.subject}{content.sender}{content.to}{content.date}{content.body_text}"
+    try:
+        text.encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    # Header lines wider than the page would need wrapping at word breaks that
+    # long address lists may not have; WeasyPrint handles those better.
+    if stringWidth(f"Subject: {content.subject}", "Helvetica-Bold", 12) > _TEXT_LINE_WIDTH:
+        return False
+    for line in (f"From: {content.sender}", f"To: {content.to}", f"Date: {content.date}"):
+        if stringWidth(line, "Helvetica", 11) > _TEXT_LINE_WIDTH:
+            return False
+    return True
 
-    pdf_path.parent.mkdir(parents=True, exist_ok=True)
-    html_string = _build_email_html(content, attachments)
-    if _render_html_to_pdf(html_string, pdf_path):
-        return
 
+def _render_text_to_pdf(content: EmailContent, attachments: list[Attachment], pdf_path: Path) -> None:
     c = canvas.Canvas(str(pdf_path), pagesize=letter)
     left = 1 * inch
     top = 10.5 * inch
     line_height = 14
 
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(left, top, f"Subject: {content.subject}")
-    c.setFont("Helvetica", 11)
-    y = top - line_height
-    c.drawString(left, y, f"From: {content.sender}")
-    y -= line_height
-    c.drawString(left, y, f"To: {content.to}")
-    y -= line_height
-    c.drawString(left, y, f"Date: {content.date}")
-
-    y -= line_height * 1.5
+    max_chars = 90
+
+    # Header lines wrap like the body; a reply to many recipients easily
+    # exceeds the page width on a single line.
+    y = _draw_paragraphs(
+        c, f"Subject: {content.subject}", left, top, max_chars, line_height, "Helvetica-Bold", 12
+    )
+    header_lines = "\n".join(
+        (f"From: {content.sender}", f"To: {content.to}", f"Date: {content.date}")
+    )
+    y = _draw_paragraphs(c, header_lines, left, y, max_chars, line_height)
+
+    y -= line_height * 0.5
     c.setFont("Helvetica", 11)
 
     body_text = content.body_text
     if not body_text and content.body_html:
         body_text = _extract_text_from_html(content.body_html)
 
-    max_chars = 90
     y = _draw_paragraphs(c, body_text, left, y, max_chars, line_height)
 
     if attachments:
@@ -308,28 +487,126 @@ def convert_eml_to_pdf(
         c.drawString(left, y, "Attachments:")
         c.setFont("Helvetica", 11)
         y -= line_height
-        for att in attachments:
-            line = f"- {att.filename} ({att.content_type}, {att.size} bytes)"
-            for wrapped in _wrap_text(line, max_chars):
-                if y <= 1 * inch:
-                    c.showPage()
-                    y = 10.5 * inch
-                c.drawString(left, y, wrapped)
-                y -= line_height
+        attachment_lines = "\n".join(
+            f"- {att.filename} ({att.content_type}, {att.size} bytes)" for att in attachments
+        )
+        y = _draw_paragraphs(c, attachment_lines, left, y, max_chars, line_height)
 
     c.save()
 
 
+def _prepare_email(
+    eml_path: Path,
+    pdf_path: Path,
+    overwrite: bool,
+    extract_attachments: bool,
+    attachments_dirname: str,
+) -> tuple[EmailContent, list[Attachment]]:
+    if pdf_path.exists() and not overwrite:
+        raise FileExistsError(f"Output exists: {pdf_path}")
+
+    msg = _read_eml(eml_path)
+    attachments_dir = None
+    if extract_attachments:
+        attachments_dir = pdf_path.parent.joinpath(attachments_dirname, eml_path.stem)
+    content, attachments = _parse_message(msg, attachments_dir)
+
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    return content, attachments
+
+
+def _render_email(content: EmailContent, attachments: list[Attachment], pdf_path: Path) -> None:
+    if _USE_HTML_RENDERER and not _prefers_text_renderer(content, attachments):
+        _render_html_to_pdf(_build_email_html(content, attachments), pdf_path)
+        return
+
+    _render_text_to_pdf(content, attachments, pdf_path)
+
+
+def convert_eml_to_pdf(
+    eml_path: Path,
+    pdf_path: Path,
+    overwrite: bool = False,
+    extract_attachments: bool = True,
+    attachments_dirname: str = "attachments",
+) -> None:
+    content, attachments = _prepare_email(
+        eml_path, pdf_path, overwrite, extract_attachments, attachments_dirname
+    )
+    _render_email(content, attachments, pdf_path)
+
+
+def _is_eml_name(name: str) -> bool:
+    return name[-4:].lower() == ".eml"
+
+
+def _scan_eml_files(directory: str, recursive: bool) -> Iterable[Path]:
+    # DirEntry type checks use d_type from readdir, so non-matching entries
+    # cost no stat() call and no Path construction.
+    subdirs = []
+    try:
+        it = os.scandir(directory)
+    except PermissionError:
+        # Skip unreadable directories, as Path.glob does.
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirs.append(entry.path)
+            elif _is_eml_name(entry.name) and entry.is_file():
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from _scan_eml_files(subdir, recursive)
+
+
 def _iter_eml_files(path: Path, recursive: bool) -> Iterable[Path]:
     if path.is_file():
         if path.suffix.lower() == ".eml":
             yield path
         return
+    if not path.is_dir():
+        return
+
+    yield from _scan_eml_files(os.fspath(path), recursive)
 
-    pattern = "**/*.eml" if recursive else "*.eml"
-    for p in path.glob(pattern):
-        if p.is_file():
-            yield p
+
+def _convert_pipelined(
+    jobs_list: list[tuple[Path, Path]],
+    overwrite: bool,
+    extract_attachments: bool,
+    attachments_dirname: str,
+) -> int:
+    # Two-stage pipeline: read/parse/save attachments on this thread while a
+    # single render thread turns the previous email into a PDF. One render
+    # thread keeps the shared WeasyPrint font configuration single-threaded.
+    count = 0
+    pending: deque[Future[None]] = deque()
+    with ThreadPoolExecutor(max_workers=1) as renderer:
+        try:
+            for eml_path, pdf_path in jobs_list:
+                content, attachments = _prepare_email(
+                    eml_path, pdf_path, overwrite, extract_attachments, attachments_dirname
+                )
+                pending.append(renderer.submit(_render_email, content, attachments, pdf_path))
+                while len(pending) > _PIPELINE_DEPTH:
+                    pending.popleft().result()
+                    count += 1
+        except KeyboardInterrupt:
+            for future in pending:
+                future.cancel()
+            raise
+        except BaseException:
+            # Emails prepared before the failure already have their attachments
+            # on disk; finish their PDFs, as a serial run would have.
+            while pending:
+                with suppress(Exception):
+                    pending.popleft().result()
+            raise
+        while pending:
+            pending.popleft().result()
+            count += 1
+    return count
 
 
 def batch_convert(
@@ -339,17 +616,58 @@ def batch_convert(
     overwrite: bool = False,
     extract_attachments: bool = True,
     attachments_dirname: str = "attachments",
+    jobs: int | None = None,
 ) -> int:
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+    jobs_list = [
+        (eml_path, output_dir / (eml_path.stem + ".pdf"))
+        for eml_path in _iter_eml_files(input_path, recursive)
+    ]
+    # Conversions run concurrently, so per-file existence checks cannot catch
+    # two inputs that map to the same output; reject them up front.
+    sources: dict[Path, Path] = {}
+    for eml_path, pdf_path in jobs_list:
+        if pdf_path in sources:
+            raise FileExistsError(
+                f"Output {pdf_path} would be written by both {sources[pdf_path]} and {eml_path}"
+            )
+        sources[pdf_path] = eml_path
+    max_workers = jobs if jobs is not None else os.cpu_count() or 1
+
+    if len(jobs_list) <= 1:
+        for eml_path, pdf_path in jobs_list:
+            convert_eml_to_pdf(
+                eml_path,
+                pdf_path,
+                overwrite=overwrite,
+                extract_attachments=extract_attachments,
+                attachments_dirname=attachments_dirname,
+            )
+        return len(jobs_list)
+
+    if max_workers == 1:
+        return _convert_pipelined(jobs_list, overwrite, extract_attachments, attachments_dirname)
+
     count = 0
-    for eml_path in _iter_eml_files(input_path, recursive):
-        rel_name = eml_path.stem + ".pdf"
-        pdf_path = output_dir / rel_name
-        convert_eml_to_pdf(
-            eml_path,
-            pdf_path,
-            overwrite=overwrite,
-            extract_attachments=extract_attachments,
-            attachments_dirname=attachments_dirname,
-        )
-        count += 1
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs_list))) as ex:
+        futures = [
+            ex.submit(
+                convert_eml_to_pdf,
+                eml_path,
+                pdf_path,
+                overwrite,
+                extract_attachments,
+                attachments_dirname,
+            )
+            for eml_path, pdf_path in jobs_list
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+                count += 1
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
     return count
@@ -1,10 +1,31 @@
 from __future__ import annotations
 
+import email
 import os
+from email import policy
 from email.message import EmailMessage
+from functools import partialmethod
 from pathlib import Path
 
-from eml2pdf.convert import batch_convert, convert_eml_to_pdf
+import pytest
+
+from eml2pdf import convert
+from eml2pdf.convert import (
+    Attachment,
+    EmailContent,
+    _build_email_html,
+    _extract_text_from_html,
+    _parse_message,
+    _wrap_text,
+    batch_convert,
+    convert_eml_to_pdf,
+)
+
+
+def _force_text(monkeypatch) -> None:
+    # The flag is read at import; set the env var too for spawned batch workers.
+    monkeypatch.setenv("EML2PDF_FORCE_TEXT", "1")
+    monkeypatch.setattr(convert, "_USE_HTML_RENDERER", False)
 
 
 def _write_eml(path: Path, msg: EmailMessage) -> None:
@@ -23,7 +44,7 @@ def _make_basic_eml(subject: str, text: str, html: str | None = None) -> EmailMe
 
 
 def test_convert_text_eml(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("EML2PDF_FORCE_TEXT", "1")
+    _force_text(monkeypatch)
 
     eml_path = tmp_path / "test.eml"
     pdf_path = tmp_path / "out.pdf"
@@ -37,7 +58,7 @@ def test_convert_text_eml(tmp_path: Path, monkeypatch) -> None:
 
 
 def test_convert_html_eml_with_attachment(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("EML2PDF_FORCE_TEXT", "1")
+    _force_text(monkeypatch)
 
     eml_path = tmp_path / "test2.eml"
     pdf_path = tmp_path / "out2.pdf"
@@ -53,7 +74,7 @@ def test_convert_html_eml_with_attachment(tmp_path: Path, monkeypatch) -> None:
 
 
 def test_attachment_name_collision(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("EML2PDF_FORCE_TEXT", "1")
+    _force_text(monkeypatch)
 
     eml_path = tmp_path / "collision.eml"
     pdf_path = tmp_path / "out3.pdf"
@@ -70,7 +91,7 @@ def test_attachment_name_collision(tmp_path: Path, monkeypatch) -> None:
 
 
 def test_batch_convert(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("EML2PDF_FORCE_TEXT", "1")
+    _force_text(monkeypatch)
     input_dir = tmp_path / "eml"
     output_dir = tmp_path / "pdf"
     input_dir.mkdir()
@@ -85,3 +106,319 @@ def test_batch_convert(tmp_path: Path, monkeypatch) -> None:
     assert count == 2
     assert (output_dir / "m0.pdf").exists()
     assert (output_dir / "m1.pdf").exists()
+
+
+def test_batch_convert_parallel(tmp_path: Path, monkeypatch) -> None:
+    _force_text(monkeypatch)
+    input_dir = tmp_path / "eml"
+    output_dir = tmp_path / "pdf"
+    input_dir.mkdir()
+
+    for i in range(4):
+        eml_path = input_dir / f"m{i}.eml"
+        msg = _make_basic_eml(f"Subject {i}", f"Body {i}")
+        _write_eml(eml_path, msg)
+
+    count = batch_convert(input_dir, output_dir, recursive=False, overwrite=True, jobs=2)
+
+    assert count == 4
+    for i in range(4):
+        assert (output_dir / f"m{i}.pdf").exists()
+
+
+def test_extract_content_decodes_encoded_headers() -> None:
+    raw = (
+        b"Received: from relay.example.com\r\n"
+        b"DKIM-Signature: v=1; a=rsa-sha256; d=example.com\r\n"
+        b"Subject: =?utf-8?q?H=C3=A9llo?= world\r\n"
+        b"From: \"=?utf-8?q?J=C3=B6rg?=\" <j@example.com>\r\n"
+        b"To: \"=?utf-8?b?w6k=?=\" <e@example.com>\r\n"
+        b"\r\n"
+        b"Body\r\n"
+    )
+    msg = email.message_from_bytes(raw, policy=policy.default)
+
+    content, attachments = _parse_message(msg)
+
+    assert content.subject == "Héllo world"
+    assert content.sender == "Jörg <j@example.com>"
+    assert content.to == "é <e@example.com>"
+    assert content.date == ""
+    assert content.body_text == "Body"
+    assert attachments == []
+
+
+def test_extract_text_from_html_drops_scripts() -> None:
+    text = _extract_text_from_html("<p>One</p><script>alert(1)</script><style>p {}</style><p>Two</p>")
+
+    assert "One" in text
+    assert "Two" in text
+    assert "alert" not in text
+    assert "p {}" not in text
+
+
+def test_batch_convert_recursive(tmp_path: Path, monkeypatch) -> None:
+    _force_text(monkeypatch)
+    input_dir = tmp_path / "eml"
+    output_dir = tmp_path / "pdf"
+    nested = input_dir / "inbox" / "2024"
+    nested.mkdir(parents=True)
+
+    _write_eml(input_dir / "top.eml", _make_basic_eml("Top", "Body"))
+    _write_eml(nested / "deep.EML", _make_basic_eml("Deep", "Body"))
+    (nested / "notes.txt").write_text("not an email")
+
+    assert batch_convert(input_dir, output_dir, recursive=False, overwrite=True, jobs=1) == 1
+    assert batch_convert(input_dir, output_dir, recursive=True, overwrite=True, jobs=1) == 2
+    assert (output_dir / "top.pdf").exists()
+    assert (output_dir / "deep.pdf").exists()
+
+
+def test_wrap_text() -> None:
+    assert list(_wrap_text("", 10)) == []
+    assert list(_wrap_text("one two  three four", 9)) == ["one two", "three", "four"]
+    assert list(_wrap_text("short averyveryverylongword end", 5)) == [
+        "short",
+        "averyveryverylongword",
+        "end",
+    ]
+
+
+def test_short_text_email_skips_html_renderer(tmp_path: Path, monkeypatch) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("HTML renderer should not be used")
+
+    monkeypatch.setattr(convert, "_USE_HTML_RENDERER", True)
+    monkeypatch.setattr(convert, "_render_html_to_pdf", _fail)
+
+    eml_path = tmp_path / "short.eml"
+    pdf_path = tmp_path / "short.pdf"
+    _write_eml(eml_path, _make_basic_eml("Short", "Just a line."))
+
+    convert_eml_to_pdf(eml_path, pdf_path, overwrite=True, extract_attachments=False)
+
+    assert pdf_path.exists()
+
+
+def test_batch_convert_serial_reports_existing_output(tmp_path: Path, monkeypatch) -> None:
+    _force_text(monkeypatch)
+    input_dir = tmp_path / "eml"
+    output_dir = tmp_path / "pdf"
+    input_dir.mkdir()
+    output_dir.mkdir()
+
+    for i in range(4):
+        _write_eml(input_dir / f"m{i}.eml", _make_basic_eml(f"Subject {i}", f"Body {i}"))
+    (output_dir / "m2.pdf").write_bytes(b"existing")
+    # Fix the processing order so m0 and m1 are prepared before m2 fails.
+    scan = convert._iter_eml_files
+    monkeypatch.setattr(convert, "_iter_eml_files", lambda *args: sorted(scan(*args)))
+
+    with pytest.raises(FileExistsError):
+        batch_convert(input_dir, output_dir, recursive=False, overwrite=False, jobs=1)
+
+    assert (output_dir / "m2.pdf").read_bytes() == b"existing"
+    assert (output_dir / "m0.pdf").exists()
+    assert (output_dir / "m1.pdf").exists()
+
+
+def test_build_email_html_escapes_values() -> None:
+    body = EmailMessage()
+    body.set_content("if (x) { y & z }")
+    content = EmailContent(
+        subject="Re: <draft>",
+        sender="a@example.com",
+        to="b@example.com",
+        date="",
+        text_part=body,
+    )
+    attachment = Attachment("a&b.txt", "text/plain", 3, Path("a&b.txt"), "")
+
+    html = _build_email_html(content, [attachment])
+
+    assert "Re: &lt;draft&gt;" in html
+    assert "<pre>if (x) { y &amp; z }</pre>" in html
+    assert "<li><strong>a&amp;b.txt</strong> (text/plain, 3 bytes)</li>" in html
+
+
+def test_unnamed_attachment_gets_generated_name(tmp_path: Path, monkeypatch) -> None:
+    _force_text(monkeypatch)
+
+    eml_path = tmp_path / "unnamed.eml"
+    pdf_path = tmp_path / "unnamed.pdf"
+    msg = _make_basic_eml("Unnamed", "Body")
+    msg.add_attachment(b"%PDF-1.4", maintype="application", subtype="pdf")
+    _write_eml(eml_path, msg)
+
+    convert_eml_to_pdf(eml_path, pdf_path, overwrite=True, extract_attachments=True)
+
+    assert (tmp_path / "attachments" / "unnamed" / "attachment-1.pdf").exists()
+
+
+def test_read_large_eml(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(convert, "_SLURP_MAX_BYTES", 1024)
+    monkeypatch.setattr(convert, "_FEED_CHUNK_BYTES", 100)
+
+    eml_path = tmp_path / "large.eml"
+    msg = _make_basic_eml("Large", "line\n" * 1000)
+    msg.add_attachment(os.urandom(4096), maintype="application", subtype="octet-stream", filename="blob.bin")
+    _write_eml(eml_path, msg)
+
+    parsed = convert._read_eml(eml_path)
+
+    assert parsed["Subject"] == "Large"
+    assert parsed.as_bytes() == msg.as_bytes()
+
+
+def test_parse_message_decodes_bodies_lazily() -> None:
+    msg = _make_basic_eml("Lazy", "Plain body", "<p>HTML body</p>")
+
+    content, _ = _parse_message(msg)
+
+    assert content.body_html == "<p>HTML body</p>"
+    assert "body_text" not in vars(content)
+    assert content.body_text == "Plain body"
+
+
+def test_batch_convert_rejects_duplicate_stems(tmp_path: Path, monkeypatch) -> None:
+    _force_text(monkeypatch)
+    input_dir = tmp_path / "eml"
+    output_dir = tmp_path / "pdf"
+    for sub in ("a", "b"):
+        (input_dir / sub).mkdir(parents=True)
+        msg = _make_basic_eml(f"Subject {sub}", "Body")
+        msg.add_attachment(b"hi", maintype="text", subtype="plain", filename="note.txt")
+        _write_eml(input_dir / sub / "x.eml", msg)
+
+    with pytest.raises(FileExistsError):
+        batch_convert(input_dir, output_dir, recursive=True, overwrite=True)
+    with pytest.raises(FileExistsError):
+        batch_convert(input_dir, output_dir, recursive=True, overwrite=True, jobs=1)
+
+    assert not (output_dir / "x.pdf").exists()
+    assert not (output_dir / "attachments").exists()
+
+
+def test_batch_convert_rejects_invalid_jobs(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        batch_convert(tmp_path, tmp_path / "pdf", jobs=0)
+
+
+def test_short_non_latin_email_uses_html_renderer(tmp_path: Path, monkeypatch) -> None:
+    rendered = []
+
+    def _record(html_string: str, pdf_path: Path) -> None:
+        rendered.append(html_string)
+        pdf_path.write_bytes(b"%PDF-1.4")
+
+    monkeypatch.setattr(convert, "_USE_HTML_RENDERER", True)
+    monkeypatch.setattr(convert, "_render_html_to_pdf", _record)
+
+    eml_path = tmp_path / "cyrillic.eml"
+    pdf_path = tmp_path / "cyrillic.pdf"
+    _write_eml(eml_path, _make_basic_eml("Привет", "Привет мир"))
+
+    convert_eml_to_pdf(eml_path, pdf_path, overwrite=True, extract_attachments=False)
+
+    assert len(rendered) == 1
+    assert "Привет мир" in rendered[0]
+
+
+def test_batch_convert_skips_unreadable_subdirectory(tmp_path: Path, monkeypatch) -> None:
+    _force_text(monkeypatch)
+    input_dir = tmp_path / "eml"
+    output_dir = tmp_path / "pdf"
+    locked = input_dir / "locked"
+    locked.mkdir(parents=True)
+    _write_eml(input_dir / "ok.eml", _make_basic_eml("Ok", "Body"))
+    _write_eml(locked / "hidden.eml", _make_basic_eml("Hidden", "Body"))
+
+    real_scandir = os.scandir
+
+    def _scandir(path):
+        if os.fspath(path) == os.fspath(locked):
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(convert.os, "scandir", _scandir)
+
+    count = batch_convert(input_dir, output_dir, recursive=True, overwrite=True, jobs=1)
+
+    assert count == 1
+    assert (output_dir / "ok.pdf").exists()
+
+
+def test_batch_convert_missing_input_converts_nothing(tmp_path: Path) -> None:
+    assert batch_convert(tmp_path / "missing", tmp_path / "pdf") == 0
+
+
+def test_batch_convert_serial_keeps_prepare_error_when_render_fails(
+    tmp_path: Path, monkeypatch
+) -> None:
+    _force_text(monkeypatch)
+    input_dir = tmp_path / "eml"
+    output_dir = tmp_path / "pdf"
+    input_dir.mkdir()
+    output_dir.mkdir()
+
+    for i in range(4):
+        _write_eml(input_dir / f"m{i}.eml", _make_basic_eml(f"Subject {i}", f"Body {i}"))
+    (output_dir / "m2.pdf").write_bytes(b"existing")
+    scan = convert._iter_eml_files
+    monkeypatch.setattr(convert, "_iter_eml_files", lambda *args: sorted(scan(*args)))
+
+    render = convert._render_email
+
+    def _render(content, attachments, pdf_path):
+        if pdf_path.name == "m0.pdf":
+            raise RuntimeError("render failed")
+        render(content, attachments, pdf_path)
+
+    monkeypatch.setattr(convert, "_render_email", _render)
+
+    with pytest.raises(FileExistsError):
+        batch_convert(input_dir, output_dir, recursive=False, overwrite=False, jobs=1)
+
+    assert (output_dir / "m1.pdf").exists()
+
+
+def _make_many_recipient_eml() -> EmailMessage:
+    msg = _make_basic_eml("Re: plans", "Sounds good.")
+    del msg["To"]
+    msg["To"] = ", ".join(f"recipient{i}@example.com" for i in range(8))
+    return msg
+
+
+def test_long_to_header_uses_html_renderer(tmp_path: Path, monkeypatch) -> None:
+    rendered = []
+
+    def _record(html_string: str, pdf_path: Path) -> None:
+        rendered.append(html_string)
+        pdf_path.write_bytes(b"%PDF-1.4")
+
+    monkeypatch.setattr(convert, "_USE_HTML_RENDERER", True)
+    monkeypatch.setattr(convert, "_render_html_to_pdf", _record)
+
+    eml_path = tmp_path / "reply.eml"
+    _write_eml(eml_path, _make_many_recipient_eml())
+
+    convert_eml_to_pdf(eml_path, tmp_path / "reply.pdf", overwrite=True, extract_attachments=False)
+
+    assert len(rendered) == 1
+    assert "recipient7@example.com" in rendered[0]
+
+
+def test_text_renderer_wraps_long_to_header(tmp_path: Path, monkeypatch) -> None:
+    # Uncompressed content streams keep the drawn text searchable.
+    init = partialmethod(convert.canvas.Canvas.__init__, pageCompression=0)
+    monkeypatch.setattr(convert.canvas.Canvas, "__init__", init)
+    msg = _make_many_recipient_eml()
+    content, _ = _parse_message(msg)
+    pdf_path = tmp_path / "reply.pdf"
+
+    convert._render_text_to_pdf(content, [], pdf_path)
+
+    data = pdf_path.read_bytes()
+    assert b"recipient7@example.com" in data
+    assert b"(To: recipient0@example.com" in data
+    assert data.count(b"recipient") == 8